@@ -5,9 +5,10 @@ import pandas as pd
 from bs4 import BeautifulSoup as Bs, BeautifulSoup
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
+from openpyxl.utils import get_column_letter
 from dotenv import load_dotenv
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, time as dt_time
 import pytz
 import sys
 import smtplib
@@ -15,8 +16,32 @@ from email.message import EmailMessage
 import gzip
 import shutil
 import time
+import hashlib
+import json
+import io
+import csv
+import html
+import math
+import random
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+# urllib3 decodes "br" responses only when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
 
 # Activate '.env' file
 env_path = Path('.') / '.env'
@@ -33,8 +58,38 @@ logging.basicConfig(
     ]
 )
 
-# Dry-run toggle
-DRY_RUN = False
+# Dry-run toggle (True = simulate against an in-memory workbook, record emails instead of sending)
+DRY_RUN = os.getenv("DRY_RUN", "False").strip().lower() == "true"
+
+# Parse cache: max cached cards, and optional file to persist the cache between runs
+PARSE_CACHE_SIZE = 512
+PARSE_CACHE_FILE = os.getenv("PARSE_CACHE_FILE")
+
+# Week sheet highlight colors (home team, SNF/MNF)
+HOME_FILL_COLOR = 'F4B084'
+NIGHT_FILL_COLOR = '00B0F0'
+
+# Optional directory for CSV/JSON/HTML copies of each week's lines
+EXPORT_DIR = os.getenv("EXPORT_DIR")
+EXPORT_FORMATS = ("csv", "json", "html")
+
+# Standings sheet and optional final score sources: a page parsed like the odds page,
+# and/or a local CSV (Team1_Abbr, Score1, Team2_Abbr, Score2) that overrides it
+STANDINGS_SHEET = "Standings"
+RESULTS_URL = os.getenv("RESULTS_URL")
+RESULTS_FILE = os.getenv("RESULTS_FILE")
+
+# History of page structure fingerprints, appended whenever the markup changes
+FINGERPRINT_CORPUS = os.path.join("logs", "page_fingerprints.jsonl")
+
+# Fetch budget per URL (seconds) and circuit breaker policy for odds sources
+FETCH_DEADLINE = 30
+CIRCUIT_FAILURE_THRESHOLD = 2
+CIRCUIT_COOLDOWN = timedelta(hours=3)
+CIRCUIT_STATE_FILE = os.getenv("CIRCUIT_STATE_FILE", os.path.join("logs", "circuit_state.json"))
+
+# Optional fallback copies of the odds page (comma-separated), parsed like scoresandodds
+ODDS_MIRROR_URLS = [url.strip() for url in os.getenv("ODDS_MIRROR_URLS", "").split(",") if url.strip()]
 
 # NFL team abbreviations
 team_abbr = {
@@ -49,7 +104,55 @@ team_abbr = {
 }
 
 
+class SystemClock:
+    """Wall clock in Pacific time; the pool's day boundaries follow Pacific time."""
+
+    def now(self):
+        return datetime.now(pytz.timezone("America/Los_Angeles"))
+
+
+class FixedClock:
+    """Clock pinned to a given instant, for simulations and tests. Naive times are read as Pacific."""
+
+    def __init__(self, now):
+        pacific = pytz.timezone("America/Los_Angeles")
+        self._now = pacific.localize(now) if now.tzinfo is None else now.astimezone(pacific)
+
+    def now(self):
+        return self._now
+
+    def advance(self, delta):
+        self._now = (self._now + delta).astimezone(pytz.timezone("America/Los_Angeles"))
+        return self._now
+
+
+system_clock = SystemClock()
+
+
+class DryRunRecorder:
+    """
+    Stands in for email and network calls while DRY_RUN is on.
+    Pages registered in `pages` are served instead of fetching the URL.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, pages=None):
+        self.pages = dict(pages or {})
+        self.emails = []
+        self.requests = []
+
+
+dry_run_recorder = DryRunRecorder()
+
+
 def send_error_email(subject, body, log_path):
+    if DRY_RUN:
+        dry_run_recorder.emails.append({"subject": subject, "body": body, "log_path": log_path})
+        logging.info(f"[DRY RUN] Email recorded, not sent: {subject}")
+        return
+
     try:
         msg = EmailMessage()
         msg["From"] = os.getenv("EMAIL_ADDRESS")
@@ -107,31 +210,146 @@ def archive_log_file():
         )
 
 
-def fetch_with_retry(url, headers=None, max_retries=3, backoff_factor=2, timeout=10):
-    attempt = 0
-    while attempt < max_retries:
+# Shared across fetches so connections are kept alive and reused
+http_session = None
+
+
+def get_session():
+    global http_session
+    if http_session is None:
+        http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        http_session.mount("https://", adapter)
+        http_session.mount("http://", adapter)
+        http_session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"})
+    return http_session
+
+
+def fetch_with_retry(url, headers=None, max_retries=3, backoff_factor=2, timeout=10, deadline=FETCH_DEADLINE):
+    """
+    GETs `url` on the shared session, retrying with jittered exponential backoff.
+    Gives up after `max_retries` attempts or once `deadline` seconds have passed.
+    """
+    session = get_session()
+    give_up_at = time.monotonic() + deadline
+    for attempt in range(1, max_retries + 1):
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0:
+            logging.warning(f"Fetch deadline of {deadline}s reached for {url}")
+            break
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = session.get(url, headers=headers, timeout=min(timeout, remaining))
             response.raise_for_status()
             return response
         except RequestException as e:
-            attempt += 1
-            wait_time = backoff_factor ** attempt
-            logging.warning(f"Request failed (attempt {attempt}/{max_retries}): {e}. Retrying in {wait_time}s...")
+            if attempt == max_retries:
+                logging.warning(f"Request failed (attempt {attempt}/{max_retries}): {e}")
+                break
+            # Full jitter keeps scheduled runs from retrying in lockstep
+            wait_time = min(random.uniform(0, backoff_factor ** attempt), max(give_up_at - time.monotonic(), 0))
+            logging.warning(f"Request failed (attempt {attempt}/{max_retries}): {e}. Retrying in {wait_time:.1f}s...")
             time.sleep(wait_time)
     logging.error(f"All {max_retries} attempts failed for URL: {url}")
     raise ConnectionError(f"Failed to fetch data from {url} after {max_retries} retries.")
 
 
-def get_webpage(url, headers=None):
+def get_webpage(url, headers=None, **fetch_options):
+    if DRY_RUN:
+        dry_run_recorder.requests.append(url)
+        if url in dry_run_recorder.pages:
+            logging.info(f"[DRY RUN] Serving recorded page for {url}")
+            return BeautifulSoup(dry_run_recorder.pages[url], "html.parser")
+
     try:
-        response = fetch_with_retry(url, headers=headers)
+        response = fetch_with_retry(url, headers=headers, **fetch_options)
         return BeautifulSoup(response.content, "html.parser")
     except Exception as e:
         logging.error(f"Failed to fetch webpage after retries: {e}")
         return None
 
 
+class CircuitBreaker:
+    """
+    Counts consecutive failed runs per source URL. After CIRCUIT_FAILURE_THRESHOLD failures
+    the source is skipped until CIRCUIT_COOLDOWN has passed, then tried once more.
+    State is kept in a JSON file so it carries over between scheduled runs.
+    """
+
+    def __init__(self, path=CIRCUIT_STATE_FILE, threshold=CIRCUIT_FAILURE_THRESHOLD,
+                 cooldown=CIRCUIT_COOLDOWN, clock=None):
+        self.path = path
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.clock = clock or system_clock
+        self.state = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.state = json.load(f)
+            except Exception as e:
+                logging.warning(f"Failed to load circuit state, starting closed: {e}")
+
+    def allow(self, key):
+        entry = self.state.get(key)
+        if not entry or entry["failures"] < self.threshold:
+            return True
+        return self.clock.now() >= datetime.fromisoformat(entry["opened_at"]) + self.cooldown
+
+    def record_success(self, key):
+        if self.state.pop(key, None) is not None:
+            logging.info(f"Circuit closed for {key}")
+            self.save()
+
+    def record_failure(self, key):
+        entry = self.state.setdefault(key, {"failures": 0, "opened_at": None})
+        entry["failures"] += 1
+        if entry["failures"] >= self.threshold:
+            entry["opened_at"] = self.clock.now().isoformat()
+            logging.warning(f"Circuit open for {key} after {entry['failures']} failed runs")
+        self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, indent=2)
+        except Exception as e:
+            logging.warning(f"Failed to save circuit state: {e}")
+
+
+@dataclass
+class OddsSource:
+    """A page of NFL lines; `parser` is a key into PARSERS."""
+    name: str
+    url: str
+    parser: str = "scoresandodds"
+
+
+def get_odds_sources():
+    sources = [OddsSource("scoresandodds", "https://www.scoresandodds.com/nfl")]
+    sources += [OddsSource(f"mirror-{i}", url) for i, url in enumerate(ODDS_MIRROR_URLS, start=1)]
+    return sources
+
+
+def fetch_odds_page(sources=None, breaker=None, **fetch_options):
+    """Returns (soup, source) from the first reachable source, or (None, None)."""
+    breaker = breaker or CircuitBreaker(path=None if DRY_RUN else CIRCUIT_STATE_FILE)
+    for source in sources or get_odds_sources():
+        if not breaker.allow(source.url):
+            logging.warning(f"Skipping {source.name}: circuit open after repeated failures")
+            continue
+        soup = get_webpage(source.url, **fetch_options)
+        if soup is None:
+            breaker.record_failure(source.url)
+            continue
+        breaker.record_success(source.url)
+        logging.info(f"Loaded odds page from {source.name} ({source.url})")
+        return soup, source
+    return None, None
+
+
 def get_week_number(soup):
     try:
         return soup.find("div", class_="filters-week-picker") \
@@ -149,6 +367,91 @@ def get_week_number(soup):
         return "Unknown"
 
 
+# Markup the parser relies on: name -> (CSS selector, scope, required).
+# "card" selectors are checked against the first event card only, so the check is constant-time.
+PAGE_SELECTORS = {
+    "week_picker": ("div.filters-week-picker div.selector.week-picker-week li.menu-item.active span[data-endpoint]", "page", True),
+    "event_card": ("div.event-card", "page", True),
+    "away_team": ('tr[data-side="away"] span.team-name a[data-abbr] span', "card", True),
+    "home_team": ('tr[data-side="home"] span.team-name a[data-abbr] span', "card", True),
+    "kickoff": ("span[data-value], div.game-date", "card", True),
+    "current_spread": ('td[data-field="current-spread"]', "card", False),
+}
+
+
+def card_skeleton_hash(card):
+    """Hash of the tag/class/data-attribute layout of a card, ignoring text and attribute values."""
+    parts = []
+    for tag in card.find_all(True):
+        data_attrs = sorted(attr for attr in tag.attrs if attr.startswith("data-"))
+        parts.append(f"{tag.name}.{'.'.join(sorted(tag.get('class', [])))}[{','.join(data_attrs)}]")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def fingerprint_page(soup):
+    card = soup.select_one("div.event-card")
+    selectors = {}
+    for name, (selector, scope, _) in PAGE_SELECTORS.items():
+        root = soup if scope == "page" else card
+        selectors[name] = root is not None and root.select_one(selector) is not None
+    return {
+        "selectors": selectors,
+        "card_hash": card_skeleton_hash(card) if card else None,
+    }
+
+
+def structure_drift(fingerprint):
+    """Returns (broken required selectors, broken optional selectors) as 'name (selector)' strings."""
+    broken, degraded = [], []
+    for name, (selector, scope, required) in PAGE_SELECTORS.items():
+        if not fingerprint["selectors"].get(name):
+            (broken if required else degraded).append(f"{name} ({scope}: {selector})")
+    return broken, degraded
+
+
+def record_fingerprint(fingerprint, url, path=FINGERPRINT_CORPUS):
+    """Appends the fingerprint to the corpus when it differs from the last recorded one."""
+    if DRY_RUN:
+        return
+    try:
+        last = None
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        last = json.loads(line)
+        if last and last["selectors"] == fingerprint["selectors"] and last["card_hash"] == fingerprint["card_hash"]:
+            return
+        if last:
+            logging.warning(f"Page structure changed since {last['recorded']}: card layout {last['card_hash']} -> {fingerprint['card_hash']}")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"recorded": datetime.now(pytz.utc).isoformat(), "url": url, **fingerprint}) + "\n")
+    except Exception as e:
+        logging.warning(f"Failed to record page fingerprint: {e}")
+
+
+def check_page_structure(soup, url):
+    """Checks the page once before any card is parsed. Returns False when a required selector is gone."""
+    fingerprint = fingerprint_page(soup)
+    record_fingerprint(fingerprint, url)
+    broken, degraded = structure_drift(fingerprint)
+
+    for selector in degraded:
+        logging.warning(f"Optional selector missing, spreads may be TBD: {selector}")
+    if not broken:
+        return True
+
+    msg = "Page structure changed; required selectors not found:\n" + "\n".join(f"  {selector}" for selector in broken)
+    logging.critical(msg)
+    send_error_email(
+        subject="NFL Scraper Error: Page Structure Changed",
+        body=f"{msg}\n\nURL: {url}\nCard layout hash: {fingerprint['card_hash']}",
+        log_path=log_file
+    )
+    return False
+
+
 def extract_team_info(table, side):
     tr = table.find("tr", attrs={"data-side": side})
     name = tr.find("span", class_="team-name").find("a").find("span").get_text().upper()
@@ -169,48 +472,328 @@ def extract_spread_and_favorite(table):
     return raw_clean, side
 
 
+@lru_cache(maxsize=256)
+def parse_date_value(value):
+    # Kickoffs are always returned tz-aware in UTC; naive ISO values are already UTC
+    dt = datetime.fromisoformat(value)
+    return dt.replace(tzinfo=pytz.utc) if dt.tzinfo is None else dt.astimezone(pytz.utc)
+
+
+# Date-only (mock) values carry no kickoff time; use the 1:00 PM Eastern slot (10:00 AM Pacific)
+MOCK_KICKOFF_TIME = dt_time(10, 0)
+
+
+@lru_cache(maxsize=256)
+def parse_game_date(date_str):
+    dt = datetime.combine(datetime.strptime(date_str, "%A, %B %d, %Y").date(), MOCK_KICKOFF_TIME)
+    return pytz.timezone("America/Los_Angeles").localize(dt).astimezone(pytz.utc)
+
+
 def extract_datetime(table):
     # Try real HTML format first
     span = table.find("span", attrs={"data-value": True})
     if span:
         try:
-            return datetime.fromisoformat(span.get("data-value"))
+            return parse_date_value(span.get("data-value"))
         except Exception:
             pass
 
     # Fallback to mock HTML format
     try:
         date_str = table.find("div", class_="game-date").get_text(strip=True)
-        return datetime.strptime(date_str, "%A, %B %d, %Y")
+        return parse_game_date(date_str)
     except Exception as e:
         logging.warning(f"Date parsing failed: {e}")
         return None
 
 
+def card_fingerprint(table):
+    """
+    Hashes the team and date subtree of an event card.
+    The spread cell is left out so a moved line still hits the cache.
+    """
+    parts = [str(span) for span in table.find_all("span", class_="team-name")]
+    span = table.find("span", attrs={"data-value": True})
+    parts.append(span.get("data-value") if span else "")
+    date_div = table.find("div", class_="game-date")
+    parts.append(date_div.get_text(strip=True) if date_div else "")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
 
-def parse_game_card(table):
+class GameCardCache:
+    """
+    LRU cache of the static fields of an event card (team names, abbreviations, kickoff).
+    Entries and the average parse time persist across runs; hit/miss stats are per run.
+    """
+
+    def __init__(self, max_size=PARSE_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.avg_parse_seconds = 0.0
+        self.parsed_samples = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.fingerprint_seconds = 0.0
+
+    def get(self, key):
+        fields = self.entries.get(key)
+        if fields is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return fields
+
+    def put(self, key, fields, parse_seconds):
+        # Running average of a full parse across runs, used to estimate time saved by hits
+        self.parsed_samples += 1
+        self.avg_parse_seconds += (parse_seconds - self.avg_parse_seconds) / self.parsed_samples
+        self.entries[key] = fields
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def time_saved(self):
+        return max(self.hits * self.avg_parse_seconds - self.fingerprint_seconds, 0.0)
+
+    def summary(self):
+        lookups = self.hits + self.misses
+        return (f"Parse cache: {self.hits}/{lookups} hits ({self.hit_rate():.0%}), "
+                f"~{self.time_saved() * 1000:.1f} ms saved")
+
+    def save(self, path):
+        data = {
+            "avg_parse_seconds": self.avg_parse_seconds,
+            "parsed_samples": self.parsed_samples,
+            "entries": [
+                [key, [away_name, away_abbr, home_name, home_abbr,
+                       date_time.isoformat() if date_time else None]]
+                for key, (away_name, away_abbr, home_name, home_abbr, date_time) in self.entries.items()
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path, max_size=PARSE_CACHE_SIZE):
+        cache = cls(max_size=max_size)
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cache.avg_parse_seconds = data.get("avg_parse_seconds", 0.0)
+        cache.parsed_samples = data.get("parsed_samples", 0)
+        for key, (away_name, away_abbr, home_name, home_abbr, date_str) in data.get("entries", []):
+            date_time = datetime.fromisoformat(date_str) if date_str else None
+            cache.entries[key] = (away_name, away_abbr, home_name, home_abbr, date_time)
+        while len(cache.entries) > max_size:
+            cache.entries.popitem(last=False)
+        return cache
+
+
+# Kept at module level so repeated runs in one process reuse parsed cards
+parse_cache = None
+
+
+def get_parse_cache():
+    global parse_cache
+    if parse_cache is None:
+        parse_cache = GameCardCache()
+        if PARSE_CACHE_FILE and os.path.exists(PARSE_CACHE_FILE):
+            try:
+                parse_cache = GameCardCache.load(PARSE_CACHE_FILE)
+                logging.info(f"Loaded {len(parse_cache.entries)} cached game cards from {PARSE_CACHE_FILE}")
+            except Exception as e:
+                logging.warning(f"Failed to load parse cache, starting empty: {e}")
+    parse_cache.reset_stats()
+    return parse_cache
+
+
+def save_parse_cache(cache):
+    if not PARSE_CACHE_FILE or DRY_RUN:
+        return
+    try:
+        cache.save(PARSE_CACHE_FILE)
+    except Exception as e:
+        logging.warning(f"Failed to save parse cache: {e}")
+
+
+def extract_card_fields(table):
     away_name, away_abbr = extract_team_info(table, "away")
     home_name, home_abbr = extract_team_info(table, "home")
-    spread, favorite_side = extract_spread_and_favorite(table)
     date_time = extract_datetime(table)
-    return [away_name, spread, home_name, away_abbr, home_abbr, home_name.upper(), date_time, favorite_side]
+    return away_name, away_abbr, home_name, home_abbr, date_time
 
 
-def scrape_nfl_data():
-    url = "https://www.scoresandodds.com/nfl"
-    soup = get_webpage(url)
+# DataFrame columns for scraped games, in GameRecord field order
+GAME_COLUMNS = [
+    "Team1", "Spread", "Team2", "Team1_Abbr", "Team2_Abbr",
+    "Home_Team", "UTC_DateTime", "Favorite_Side"
+]
+
+# int64 sentinel for a missing kickoff (same value pandas uses for NaT)
+NAT_SENTINEL = np.iinfo(np.int64).min
+
+
+class GameRecord(NamedTuple):
+    """One parsed event card. Team1 is the away team; spread is NaN until the line is posted."""
+    team1: str
+    spread: float
+    team2: str
+    team1_abbr: str
+    team2_abbr: str
+    home_team: str
+    utc_datetime: Optional[datetime]
+    favorite_side: Optional[str]
+
+
+def parse_spread(raw):
+    if raw is None or raw == "TBD":
+        return math.nan
+    try:
+        return float(raw)
+    except ValueError:
+        logging.warning(f"Unparseable spread {raw!r}, treating as TBD")
+        return math.nan
+
+
+def validate_game_record(record):
+    """
+    Returns a list of problems with a parsed record; empty when it is usable.
+    A missing kickoff is not a problem: the game keeps its place (and Excel row) with a NaT kickoff.
+    """
+    problems = []
+    for field in ("team1", "team2", "team1_abbr", "team2_abbr"):
+        if not getattr(record, field):
+            problems.append(f"missing {field}")
+    if not isinstance(record.spread, float):
+        problems.append(f"spread is {type(record.spread).__name__}, expected float")
+    if record.favorite_side not in ("home", "away", None):
+        problems.append(f"unexpected favorite_side {record.favorite_side!r}")
+    if record.utc_datetime is not None and (
+        not isinstance(record.utc_datetime, datetime) or record.utc_datetime.tzinfo is None
+    ):
+        problems.append("kickoff time is not tz-aware")
+    return problems
+
+
+@dataclass
+class GameBatch:
+    """
+    Columnar, typed view of a slate: team codes index into `teams`, spreads are
+    float32 with NaN for TBD, kickoffs are int64 ns since epoch (UTC), and
+    favorite_side is 1 home / -1 away / 0 unknown. Home team is always team2.
+    """
+    teams: np.ndarray
+    abbrs: np.ndarray
+    team1: np.ndarray
+    team2: np.ndarray
+    team1_abbr: np.ndarray
+    team2_abbr: np.ndarray
+    spread: np.ndarray
+    kickoff: np.ndarray
+    favorite_side: np.ndarray
+
+    def __len__(self):
+        return len(self.spread)
+
+    def to_frame(self):
+        """Builds the DataFrame the rest of the pipeline expects (GAME_COLUMNS)."""
+        team1 = pd.Categorical.from_codes(self.team1, categories=self.teams)
+        team2 = pd.Categorical.from_codes(self.team2, categories=self.teams)
+        kickoff = np.where(self.kickoff == NAT_SENTINEL, np.datetime64("NaT", "ns"), self.kickoff.view("datetime64[ns]"))
+        return pd.DataFrame({
+            "Team1": team1,
+            "Spread": self.spread,
+            "Team2": team2,
+            "Team1_Abbr": pd.Categorical.from_codes(self.team1_abbr, categories=self.abbrs),
+            "Team2_Abbr": pd.Categorical.from_codes(self.team2_abbr, categories=self.abbrs),
+            "Home_Team": team2,
+            "UTC_DateTime": pd.to_datetime(kickoff).tz_localize("UTC"),
+            "Favorite_Side": pd.Categorical.from_codes(
+                np.select([self.favorite_side == 1, self.favorite_side == -1], [1, 0], default=-1),
+                categories=["away", "home"]
+            ),
+        })
+
+
+def build_game_batch(records):
+    """Packs GameRecords into a GameBatch, one column at a time."""
+    columns = list(zip(*records)) if records else [()] * len(GAME_COLUMNS)
+    team1, spread, team2, team1_abbr, team2_abbr, _, kickoffs, sides = columns
+    count = len(spread)
+
+    team_codes, teams = pd.factorize(np.array(team1 + team2, dtype=object))
+    abbr_codes, abbr_values = pd.factorize(np.array(team1_abbr + team2_abbr, dtype=object))
+    kickoff = pd.DatetimeIndex(pd.to_datetime(list(kickoffs), utc=True)).as_unit("ns").asi8
+    sides = np.array(sides, dtype=object)
+
+    return GameBatch(
+        teams=np.asarray(teams, dtype=object),
+        abbrs=np.asarray(abbr_values, dtype=object),
+        team1=team_codes[:count].astype(np.int16),
+        team2=team_codes[count:].astype(np.int16),
+        team1_abbr=abbr_codes[:count].astype(np.int16),
+        team2_abbr=abbr_codes[count:].astype(np.int16),
+        spread=np.array(spread, dtype=np.float32),
+        kickoff=kickoff.astype(np.int64),
+        favorite_side=np.select([sides == "home", sides == "away"], [1, -1], default=0).astype(np.int8),
+    )
+
+
+def parse_game_card(table, cache=None):
+    if cache is None:
+        fields = extract_card_fields(table)
+    else:
+        start = time.perf_counter()
+        key = card_fingerprint(table)
+        cache.fingerprint_seconds += time.perf_counter() - start
+        fields = cache.get(key)
+        if fields is None:
+            start = time.perf_counter()
+            fields = extract_card_fields(table)
+            cache.put(key, fields, time.perf_counter() - start)
+
+    # Spreads move between runs, so they are always re-extracted
+    away_name, away_abbr, home_name, home_abbr, date_time = fields
+    spread, favorite_side = extract_spread_and_favorite(table)
+    return GameRecord(away_name, parse_spread(spread), home_name, away_abbr, home_abbr,
+                      home_name.upper(), date_time, favorite_side)
+
+
+# Page parsers by name; each OddsSource names the one that reads its markup
+PARSERS = {
+    "scoresandodds": {
+        "check": check_page_structure,
+        "week": get_week_number,
+        "card": parse_game_card,
+    },
+}
+
+
+def scrape_nfl_data(sources=None, breaker=None):
+    soup, source = fetch_odds_page(sources, breaker)
 
     if not soup:
         logging.error("Failed to load NFL page.")
         send_error_email(
             subject="NFL Scraper Error: Page Load Failure",
-            body="Failed to load NFL page from scoresandodds.com.",
+            body="Failed to load NFL page from every odds source (see log for skipped or failed sources).",
             log_path=log_file
         )
         return None, "Unknown"
 
+    parser = PARSERS[source.parser]
+    if not parser["check"](soup, source.url):
+        return None, "Unknown"
+
     try:
-        week = get_week_number(soup)
+        week = parser["week"](soup)
         logging.info(f"Scraping data for Week {week}")
     except Exception as e:
         logging.error(f"Failed to extract week number: {e}", exc_info=True)
@@ -224,11 +807,16 @@ def scrape_nfl_data():
     data = []
     finalized_count = 0
     pending_count = 0
+    cache = get_parse_cache()
 
     for table in soup.find_all("div", class_="event-card"):
         try:
-            row = parse_game_card(table)
-            if row[1] == "TBD":
+            row = parser["card"](table, cache=cache)
+            problems = validate_game_record(row)
+            if problems:
+                logging.warning(f"Skipping invalid game card {row.team1} vs {row.team2}: {', '.join(problems)}")
+                continue
+            if math.isnan(row.spread):
                 pending_count += 1
             else:
                 finalized_count += 1
@@ -236,6 +824,9 @@ def scrape_nfl_data():
         except Exception as e:
             logging.warning(f"Failed to parse game card: {e}")
 
+    logging.info(cache.summary())
+    save_parse_cache(cache)
+
     if not data:
         logging.error("No game data found.")
         send_error_email(
@@ -246,10 +837,7 @@ def scrape_nfl_data():
         return None, week
 
     try:
-        df = pd.DataFrame(data, columns=[
-            "Team1", "Spread", "Team2", "Team1_Abbr", "Team2_Abbr",
-            "Home_Team", "UTC_DateTime", "Favorite_Side"
-        ])
+        df = build_game_batch(data).to_frame()
 
         # ✅ Inject game_day from UTC_DateTime
         df["game_day"] = pd.to_datetime(df["UTC_DateTime"], errors="coerce").dt.day_name()
@@ -268,10 +856,14 @@ def scrape_nfl_data():
 
 
 def apply_team_abbreviations(df):
-    df["Team1"] = df["Team1"].str.upper()
-    df["Team2"] = df["Team2"].str.upper()
-    df["Team1_Abbr"] = df["Team1"].map(team_abbr)
-    df["Team2_Abbr"] = df["Team2"].map(team_abbr)
+    for team, abbr in (("Team1", "Team1_Abbr"), ("Team2", "Team2_Abbr")):
+        if isinstance(df[team].dtype, pd.CategoricalDtype):
+            # GameBatch frames: map the categories rather than every row so the columns stay categorical
+            df[team] = df[team].map(str.upper).astype("category")
+            df[abbr] = df[team].map(team_abbr).astype("category")
+        else:
+            df[team] = df[team].str.upper()
+            df[abbr] = df[team].map(team_abbr)
 
     missing_team1 = df[df["Team1_Abbr"].isna()]["Team1"].unique()
     missing_team2 = df[df["Team2_Abbr"].isna()]["Team2"].unique()
@@ -296,7 +888,7 @@ def extract_favorite_underdog(row):
     abbr1 = row["Team1_Abbr"]
     abbr2 = row["Team2_Abbr"]
 
-    if spread_val == "TBD" or favorite_side not in ["home", "away"]:
+    if spread_val == "TBD" or pd.isna(spread_val) or favorite_side not in ["home", "away"]:
         return "TBD", "TBD", 0.0, None, None
 
     try:
@@ -331,13 +923,12 @@ def extract_favorite_underdog(row):
     return favorite, underdog, spread_display, fav_abbr, und_abbr
 
 
-def filter_games_by_day(df):
-    pacific = pytz.timezone("America/Los_Angeles")
-    now = datetime.now(pacific)
+def filter_games_by_day(df, clock=None):
+    now = (clock or system_clock).now()
     dotw = now.strftime("%A")
 
-    # ✅ Ensure UTC_DateTime is a datetime object
-    df["UTC_DateTime"] = pd.to_datetime(df["UTC_DateTime"], errors="coerce")
+    # ✅ Ensure UTC_DateTime is a tz-aware datetime
+    df["UTC_DateTime"] = pd.to_datetime(df["UTC_DateTime"], errors="coerce", utc=True)
 
     # ✅ Filter out games that have already started
     df_filtered = df[df["UTC_DateTime"] > now].copy()
@@ -391,16 +982,22 @@ def get_local_datetime(utc_str):
         return None
 
 
-def update_excel(wk_number, df_filtered, dotw):
+def update_excel(wk_number, df_filtered, dotw, wb=None):
+    """
+    Writes the filtered games into the week sheet.
+    When `wb` is given the caller owns the workbook and nothing is saved to disk.
+    """
     try:
         file = os.getenv("file_path")
-        wb = load_workbook(filename=file)
+        in_memory = wb is not None
+        if not in_memory:
+            wb = load_workbook(filename=file)
         all_sheets = wb.sheetnames
         template = wb.worksheets[0]
 
-        home_fill = PatternFill(start_color='F4B084', end_color='F4B084', fill_type='solid')
+        home_fill = PatternFill(start_color=HOME_FILL_COLOR, end_color=HOME_FILL_COLOR, fill_type='solid')
         clear_fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-        night_fill = PatternFill(start_color='00B0F0', end_color='00B0F0', fill_type='solid')  # SNF/MNF highlight
+        night_fill = PatternFill(start_color=NIGHT_FILL_COLOR, end_color=NIGHT_FILL_COLOR, fill_type='solid')  # SNF/MNF highlight
 
         # Create or overwrite sheet
         if wk_number in all_sheets:
@@ -502,8 +1099,12 @@ def update_excel(wk_number, df_filtered, dotw):
             except Exception as e:
                 logging.warning(f"Error updating row {row.get('Excel_Row', 'Unknown')}: {e}")
 
-        wb.save(file)
-        logging.info(f"Excel updated and saved for {wk_number}")
+        if in_memory or DRY_RUN:
+            logging.info(f"Excel updated in memory for {wk_number} (not saved)")
+        else:
+            wb.save(file)
+            logging.info(f"Excel updated and saved for {wk_number}")
+        return wb
 
     except Exception as e:
         logging.critical(f"Excel update failed: {e}", exc_info=True)
@@ -518,6 +1119,334 @@ def update_excel(wk_number, df_filtered, dotw):
             log_path=log_file
         )
 
+def has_fill(cell, color):
+    return bool(cell.fill.fill_type) and str(cell.fill.fgColor.rgb).upper().endswith(color)
+
+
+def iter_slate(ws):
+    """Yields the games written to a week sheet, in sheet order."""
+    for cells in ws.iter_rows(min_row=2, max_col=15):
+        favorite_cell, spread_cell, underdog_cell = cells[2], cells[3], cells[4]
+        if favorite_cell.value is None:
+            continue
+        if has_fill(favorite_cell, HOME_FILL_COLOR):
+            home = "favorite"
+        elif has_fill(underdog_cell, HOME_FILL_COLOR):
+            home = "underdog"
+        else:
+            home = ""
+        yield {
+            "row": favorite_cell.row,
+            "favorite": favorite_cell.value,
+            "fav_abbr": cells[8].value,
+            "spread": spread_cell.value,
+            "underdog": underdog_cell.value,
+            "und_abbr": cells[10].value,
+            "home": home,
+            "night_game": has_fill(cells[13], NIGHT_FILL_COLOR),
+        }
+
+
+def write_if_changed(path, content):
+    """Writes `content` atomically unless the file already holds the same bytes. Returns True if written."""
+    digest = hashlib.sha256(content).hexdigest()
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() == digest:
+                return False
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def export_slate(wb, wk_number, out_dir, formats=EXPORT_FORMATS):
+    """
+    Renders the week sheet to CSV, JSON and a static HTML picks page in a single pass over its rows.
+    Files whose content has not changed are left untouched. Returns {format: path or None if unchanged}.
+    """
+    try:
+        ws = wb[wk_number]
+        columns = ["row", "favorite", "fav_abbr", "spread", "underdog", "und_abbr", "home", "night_game"]
+
+        csv_buffer = io.StringIO()
+        csv_writer = csv.DictWriter(csv_buffer, fieldnames=columns, lineterminator="\n")
+        csv_writer.writeheader()
+        json_records = []
+        html_rows = []
+
+        for game in iter_slate(ws):
+            csv_writer.writerow(game)
+            json_records.append(json.dumps(game))
+            fav_style = " class=\"home\"" if game["home"] == "favorite" else ""
+            und_style = " class=\"home\"" if game["home"] == "underdog" else ""
+            night = " class=\"night\"" if game["night_game"] else ""
+            html_rows.append(
+                f"<tr{night}><td{fav_style}>{html.escape(str(game['favorite']))}</td>"
+                f"<td>{html.escape(str(game['spread']))}</td>"
+                f"<td{und_style}>{html.escape(str(game['underdog']))}</td></tr>"
+            )
+
+        title = html.escape(f"Family Football Pool - Week {wk_number}")
+        rendered = {
+            "csv": csv_buffer.getvalue(),
+            "json": f"{{\"week\": {json.dumps(str(wk_number))}, \"games\": [\n" + ",\n".join(json_records) + "\n]}\n",
+            "html": (
+                f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+                f"<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\"><title>{title}</title>"
+                f"<style>td{{padding:4px 8px}} .home{{background:#{HOME_FILL_COLOR}}} "
+                f"tr.night td{{border-bottom:3px solid #{NIGHT_FILL_COLOR}}}</style></head>\n"
+                f"<body><h1>{title}</h1>\n<table>\n<tr><th>Favorite</th><th>Spread</th><th>Underdog</th></tr>\n"
+                + "\n".join(html_rows) + "\n</table></body></html>\n"
+            ),
+        }
+
+        os.makedirs(out_dir, exist_ok=True)
+        written = {}
+        for fmt in formats:
+            path = os.path.join(out_dir, f"week_{wk_number}.{fmt}")
+            if write_if_changed(path, rendered[fmt].encode("utf-8")):
+                logging.info(f"Exported {path}")
+                written[fmt] = path
+            else:
+                logging.info(f"Export unchanged, skipped {path}")
+                written[fmt] = None
+        return written
+
+    except Exception as e:
+        logging.error(f"Slate export failed: {e}", exc_info=True)
+        send_error_email(
+            subject="NFL Spread Script: ERROR - Slate Export Failed",
+            body=f"Failed to export week {wk_number} slate:\n{e}",
+            log_path=log_file
+        )
+        return {}
+
+
+def extract_final_score(table, side):
+    tr = table.find("tr", attrs={"data-side": side})
+    td = tr.find("td", attrs={"data-field": "score"}) if tr else None
+    raw = td.get_text(strip=True) if td else ""
+    return int(raw) if raw.isdigit() else None
+
+
+def scrape_final_scores(url="https://www.scoresandodds.com/nfl"):
+    """
+    Reads final scores from an odds page, using parse_game_card() for the teams.
+    Returns {frozenset((abbr1, abbr2)): {abbr: score}} for games with both scores posted.
+    """
+    soup = get_webpage(url)
+    if not soup:
+        logging.error(f"Failed to load results page: {url}")
+        return {}
+
+    results = {}
+    for table in soup.find_all("div", class_="event-card"):
+        try:
+            row = parse_game_card(table)
+            away_abbr = team_abbr.get(row[0], row[3])
+            home_abbr = team_abbr.get(row[2], row[4])
+            away_score = extract_final_score(table, "away")
+            home_score = extract_final_score(table, "home")
+        except Exception as e:
+            logging.warning(f"Failed to parse results card: {e}")
+            continue
+        if away_score is not None and home_score is not None:
+            results[frozenset((away_abbr, home_abbr))] = {away_abbr: away_score, home_abbr: home_score}
+    logging.info(f"Loaded {len(results)} final scores from {url}")
+    return results
+
+
+def load_results_file(path):
+    """Reads final scores from a CSV with Team1_Abbr, Score1, Team2_Abbr, Score2 columns."""
+    df = pd.read_csv(path)
+    results = {}
+    for team1, score1, team2, score2 in df[["Team1_Abbr", "Score1", "Team2_Abbr", "Score2"]].itertuples(index=False):
+        results[frozenset((team1, team2))] = {team1: int(score1), team2: int(score2)}
+    logging.info(f"Loaded {len(results)} final scores from {path}")
+    return results
+
+
+def load_results():
+    """Collects final scores from RESULTS_URL and RESULTS_FILE; returns None when neither is set."""
+    if not RESULTS_URL and not RESULTS_FILE:
+        return None
+    results = {}
+    if RESULTS_URL:
+        results.update(scrape_final_scores(RESULTS_URL))
+    if RESULTS_FILE:
+        if os.path.exists(RESULTS_FILE):
+            results.update(load_results_file(RESULTS_FILE))
+        else:
+            logging.warning(f"Results file {RESULTS_FILE} not found, using scores already in the workbook")
+    return results
+
+
+def read_standings(ws):
+    rows = ws.iter_rows(min_row=2, max_col=6, values_only=True)
+    weekly = [row for row in rows if row and row[0] is not None]
+    return pd.DataFrame(weekly, columns=["Week", "Participant", "Wins", "Losses", "Pushes", "Final"])
+
+
+def read_week_sheet(ws, week):
+    """
+    Streams one week sheet: games from the line/score columns and picks from the
+    participant columns (A:B pick the favorite, F:G pick the underdog; row 1 holds initials).
+    """
+    games = []
+    picks = []
+    rows = ws.iter_rows(max_col=15, values_only=True)
+    header = tuple(next(rows, ())) + (None,) * 15
+    favorite_pickers = [(col, header[col]) for col in (0, 1) if header[col]]
+    underdog_pickers = [(col, header[col]) for col in (5, 6) if header[col]]
+
+    for excel_row, values in enumerate(rows, start=2):
+        values = tuple(values) + (None,) * (15 - len(values))
+        spread = values[3]
+        if values[2] is None or not isinstance(spread, (int, float)):
+            continue
+        games.append((week, excel_row, values[8], float(spread), values[10], values[9], values[11]))
+        for col, participant in favorite_pickers:
+            if values[col] not in (None, ""):
+                picks.append((week, excel_row, participant, 1))
+        for col, participant in underdog_pickers:
+            if values[col] not in (None, ""):
+                picks.append((week, excel_row, participant, -1))
+
+    games = pd.DataFrame(games, columns=["Week", "Row", "Fav_Abbr", "Spread", "Und_Abbr", "Fav_Score", "Und_Score"])
+    picks = pd.DataFrame(picks, columns=["Week", "Row", "Participant", "Side"])
+    return games, picks
+
+
+def apply_results(games, results):
+    if not results or games.empty:
+        return games
+    scores = [results.get(frozenset((fav, und)), {}) for fav, und in zip(games["Fav_Abbr"], games["Und_Abbr"])]
+    fav_scores = pd.Series([score.get(fav) for score, fav in zip(scores, games["Fav_Abbr"])], index=games.index)
+    und_scores = pd.Series([score.get(und) for score, und in zip(scores, games["Und_Abbr"])], index=games.index)
+    games["Fav_Score"] = fav_scores.astype("float64").fillna(pd.to_numeric(games["Fav_Score"], errors="coerce"))
+    games["Und_Score"] = und_scores.astype("float64").fillna(pd.to_numeric(games["Und_Score"], errors="coerce"))
+    return games
+
+
+def score_picks(games, picks):
+    """
+    Grades picks against the spread. Returns one row per week and participant
+    with Wins/Losses/Pushes and whether every game in the week is final.
+    """
+    columns = ["Week", "Participant", "Wins", "Losses", "Pushes", "Final"]
+    if picks.empty:
+        return pd.DataFrame(columns=columns)
+
+    fav_score = pd.to_numeric(games["Fav_Score"], errors="coerce")
+    und_score = pd.to_numeric(games["Und_Score"], errors="coerce")
+    # +1 favorite covers, -1 underdog covers, 0 push, NaN not final
+    games = games.assign(Cover=np.sign(fav_score - und_score - games["Spread"]))
+
+    graded = picks.merge(games[["Week", "Row", "Cover"]], on=["Week", "Row"], how="left")
+    final = graded["Cover"].notna()
+    graded["Wins"] = final & (graded["Cover"] == graded["Side"])
+    graded["Pushes"] = final & (graded["Cover"] == 0)
+    graded["Losses"] = final & ~graded["Wins"] & ~graded["Pushes"]
+
+    weekly = graded.groupby(["Week", "Participant"], as_index=False).agg(
+        Wins=("Wins", "sum"), Losses=("Losses", "sum"), Pushes=("Pushes", "sum")
+    )
+    # A week is final once every game on the sheet has a score, picked or not
+    week_final = games["Cover"].notna().groupby(games["Week"]).all()
+    weekly["Final"] = weekly["Week"].map(week_final).fillna(False).astype(bool)
+    return weekly[columns]
+
+
+def season_standings(weekly):
+    season = weekly.groupby("Participant", as_index=False)[["Wins", "Losses", "Pushes"]].sum()
+    decided = season["Wins"] + season["Losses"]
+    season["Win_Pct"] = (season["Wins"] / decided.where(decided > 0)).fillna(0.0).round(3)
+    return season.sort_values(["Wins", "Win_Pct"], ascending=False).reset_index(drop=True)
+
+
+def write_standings(wb, weekly, season):
+    if STANDINGS_SHEET in wb.sheetnames:
+        del wb[STANDINGS_SHEET]
+    ws = wb.create_sheet(STANDINGS_SHEET)
+
+    ws.append(["Week", "Participant", "Wins", "Losses", "Pushes", "Final", None,
+               "Participant", "Wins", "Losses", "Pushes", "Win_Pct"])
+    weekly_rows = weekly.itertuples(index=False)
+    season_rows = season.itertuples(index=False)
+    for _ in range(max(len(weekly), len(season))):
+        week_row = next(weekly_rows, None)
+        season_row = next(season_rows, None)
+        left = [week_row.Week, week_row.Participant, int(week_row.Wins), int(week_row.Losses),
+                int(week_row.Pushes), bool(week_row.Final)] if week_row else [None] * 6
+        right = [season_row.Participant, int(season_row.Wins), int(season_row.Losses),
+                 int(season_row.Pushes), float(season_row.Win_Pct)] if season_row else [None] * 5
+        ws.append(left + [None] + right)
+
+
+def update_standings(file=None, results=None):
+    """
+    Scores week sheets that are not final yet and rewrites the standings sheet.
+    Weeks already marked final in the standings sheet are not read again.
+    """
+    try:
+        file = file or os.getenv("file_path")
+        if results is None:
+            results = load_results()
+
+        # Streaming pass: existing standings plus any week sheets still open
+        wb = load_workbook(filename=file, read_only=True, data_only=True)
+        try:
+            if STANDINGS_SHEET in wb.sheetnames:
+                stored = read_standings(wb[STANDINGS_SHEET])
+            else:
+                stored = pd.DataFrame(columns=["Week", "Participant", "Wins", "Losses", "Pushes", "Final"])
+            stored["Week"] = stored["Week"].astype(str)
+            final_weeks = set(stored.loc[stored["Final"].astype(bool), "Week"])
+
+            open_weeks = [name for name in wb.sheetnames if name.isdigit() and name not in final_weeks]
+            week_games, week_picks = [], []
+            for week in open_weeks:
+                games, picks = read_week_sheet(wb[week], week)
+                week_games.append(apply_results(games, results))
+                week_picks.append(picks)
+        finally:
+            wb.close()
+
+        if open_weeks:
+            scored = score_picks(pd.concat(week_games, ignore_index=True), pd.concat(week_picks, ignore_index=True))
+        else:
+            scored = stored.iloc[0:0]
+        logging.info(f"Scored weeks {open_weeks or 'none'}; {len(final_weeks)} final weeks reused")
+
+        weekly = pd.concat([stored[stored["Week"].isin(final_weeks)], scored], ignore_index=True)
+        weekly = weekly.sort_values(
+            ["Week", "Participant"], key=lambda col: col.astype(int) if col.name == "Week" else col
+        ).reset_index(drop=True)
+        season = season_standings(weekly)
+        logging.info("Season standings:\n" + season.to_string(index=False))
+
+        if DRY_RUN:
+            logging.info("[DRY RUN] Standings not saved")
+            return season
+
+        wb = load_workbook(filename=file)
+        write_standings(wb, weekly, season)
+        wb.save(file)
+        logging.info(f"Standings saved to {STANDINGS_SHEET} sheet")
+        return season
+
+    except Exception as e:
+        logging.critical(f"Standings update failed: {e}", exc_info=True)
+        send_error_email(
+            subject="NFL Spread Script: ERROR - Standings Update Failed",
+            body=f"Standings update failed:\n{e}",
+            log_path=log_file
+        )
+        return None
+
+
 def verify_matchkey_alignment(df_full, df_filtered):
     full_keys = df_full["MatchKey"].drop_duplicates()
     filtered_keys = df_filtered["MatchKey"].drop_duplicates()
@@ -536,9 +1465,12 @@ def verify_matchkey_alignment(df_full, df_filtered):
         )
 
 def normalize_matchkeys(df):
-    df["Team1"] = df["Team1"].astype(str).str.strip().str.upper()
-    df["Team2"] = df["Team2"].astype(str).str.strip().str.upper()
-    df["MatchKey"] = (df["Team1"] + " vs " + df["Team2"]).str.strip().str.upper()
+    for team in ("Team1", "Team2"):
+        if isinstance(df[team].dtype, pd.CategoricalDtype):
+            df[team] = df[team].map(lambda name: str(name).strip().upper()).astype("category")
+        else:
+            df[team] = df[team].astype(str).str.strip().str.upper()
+    df["MatchKey"] = (df["Team1"].astype(str) + " vs " + df["Team2"].astype(str)).str.strip().str.upper()
     return df
 
 def assign_excel_rows(df):
@@ -560,10 +1492,251 @@ def assign_excel_rows(df):
 
     return excel_rows
 
-def main():
+def prepare_games(df_raw, clock=None):
+    """
+    Localizes game days, assigns Excel rows and drops games that have started.
+    Returns (df_filtered, dotw); df_filtered is None when the pipeline must stop.
+    """
+    # ✅ Localize game_day to Pacific Time
+    df_raw["game_day"] = (
+        pd.to_datetime(df_raw["UTC_DateTime"], errors="coerce", utc=True)
+        .dt.tz_convert("America/Los_Angeles")
+        .dt.day_name()
+    )
+
+    # ✅ Preview game_day assignments
+    logging.info("Preview of game_day assignments:")
+    logging.info(df_raw[["Team1", "Team2", "UTC_DateTime", "game_day"]].to_string(index=False))
+
+    df_raw = normalize_matchkeys(df_raw)
+
+    # ✅ Count how many games have already started
+    clock = clock or system_clock
+    now = clock.now()
+    df_raw["UTC_DateTime"] = pd.to_datetime(df_raw["UTC_DateTime"], errors="coerce", utc=True)
+    excluded_count = len(df_raw[df_raw["UTC_DateTime"] <= now])
+    logging.info(f"Detected {excluded_count} played games before {now.strftime('%A %I:%M %p')}")
+
+    # ✅ Assign Excel_Row from the game's place in the full schedule (played games included),
+    # so a game keeps its row for the whole week
+    df_raw = df_raw.reset_index(drop=True)
+    df_raw["Excel_Row"] = df_raw.index + 2
+
+    # ✅ Filter out played games — Excel_Row is preserved
+    df_filtered, dotw = filter_games_by_day(df_raw, clock=clock)
+
+    # ✅ Confirm Excel_Row exists
+    if "Excel_Row" not in df_filtered.columns:
+        msg = "Excel_Row missing from filtered DataFrame. Aborting."
+        logging.critical(msg)
+        send_error_email(
+            subject="NFL Automation Critical Error: Excel_Row Missing",
+            body=msg,
+            log_path=log_file
+        )
+        return None, dotw
+
+    # ✅ Confirm all rows have Excel_Row
+    unmatched = df_filtered[df_filtered["Excel_Row"].isna()]
+    if not unmatched.empty:
+        logging.warning(f"Unmatched rows after filtering: {len(unmatched)}")
+        for _, row in unmatched.iterrows():
+            logging.warning(f"  {row['Team1']} vs {row['Team2']} — MatchKey: {row['MatchKey']}")
+    else:
+        logging.info("[OK] All filtered games have Excel_Row assigned.")
+
+    # ✅ Preview post-filter
+    logging.info("Post-filter preview:")
+    preview_cols = ["Team1", "Team2", "MatchKey", "Excel_Row"]
+    logging.info(df_filtered[preview_cols].to_string(index=False))
+
+    return df_filtered, dotw
+
+
+def load_workbook_snapshot(path):
+    """Reads the workbook once so simulations can clone it without touching disk again."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def clone_workbook(snapshot):
+    return load_workbook(io.BytesIO(snapshot))
+
+
+def snapshot_sheet(ws):
+    cells = {}
+    for row in ws.iter_rows():
+        for cell in row:
+            fill = cell.fill.fgColor.rgb if cell.fill.fill_type else None
+            cells[(cell.row, cell.column)] = (cell.value, fill)
+    return cells
+
+
+def diff_sheets(before, after):
+    diff = []
+    for key in sorted(set(before) | set(after)):
+        old_value, old_fill = before.get(key, (None, None))
+        new_value, new_fill = after.get(key, (None, None))
+        coordinate = f"{get_column_letter(key[1])}{key[0]}"
+        if old_value != new_value:
+            diff.append({"cell": coordinate, "row": key[0], "field": "value", "before": old_value, "after": new_value})
+        if old_fill != new_fill:
+            diff.append({"cell": coordinate, "row": key[0], "field": "fill", "before": old_fill, "after": new_fill})
+    return diff
+
+
+def check_game_rows(df_raw, df_filtered, dotw, diff, games):
+    """
+    Compares this run against the rows games were written to in earlier runs.
+    `games` maps MatchKey -> {"row", "frozen"} and is updated in place; frozen games
+    have started or been locked. Returns changes to protected rows plus games written
+    to a different row than before.
+    """
+    today = dotw.strip().title()
+    df_filtered = df_filtered[df_filtered["Excel_Row"].notna()]
+    locked_now = df_filtered[df_filtered["game_day"] == today]
+    written = df_filtered[df_filtered["game_day"] != today]
+    all_keys = set(normalize_matchkeys(df_raw[["Team1", "Team2"]].copy())["MatchKey"])
+    started_keys = all_keys - set(df_filtered["MatchKey"])
+
+    # Rows of games that started or are locked keep whatever they held before this run
+    protected = {entry["row"] for entry in games.values() if entry["frozen"]}
+    for key, row in zip(locked_now["MatchKey"], locked_now["Excel_Row"].astype(int)):
+        protected.add(games[key]["row"] if key in games else row)
+    protected.update(games[key]["row"] for key in started_keys if key in games)
+    violations = [change for change in diff if change["row"] in protected]
+
+    for key, row in zip(written["MatchKey"], written["Excel_Row"].astype(int)):
+        previous = games.get(key)
+        if previous and previous["row"] != row:
+            violations.append({"cell": None, "row": row, "field": "row_moved", "game": key,
+                               "before": previous["row"], "after": row})
+        games[key] = {"row": row, "frozen": False}
+    for key, row in zip(locked_now["MatchKey"], locked_now["Excel_Row"].astype(int)):
+        games.setdefault(key, {"row": row})["frozen"] = True
+    for key in started_keys:
+        if key in games:
+            games[key]["frozen"] = True
+    return violations
+
+
+def simulate_run(wb, clock=None, pages=None, games=None):
+    """
+    Runs the full pipeline in dry-run mode against an in-memory workbook.
+    Emails and page requests are recorded; `pages` maps URL -> HTML to serve instead of fetching.
+    Pass the same `games` dict to chained runs to track each game's row between them.
+    Returns a dict with the cell-level diff, stage timings and recorded calls.
+    """
+    global DRY_RUN
+    previous_dry_run = DRY_RUN
+    DRY_RUN = True
+    dry_run_recorder.reset(pages)
+    timings = {}
+    clock = clock or system_clock
+    result = {"now": clock.now(), "week": "Unknown", "dotw": None, "diff": [], "timings": timings,
+              "lock_violations": [], "emails": dry_run_recorder.emails, "requests": dry_run_recorder.requests}
+
+    try:
+        start = time.perf_counter()
+        df_raw, week_label = scrape_nfl_data()
+        timings["scrape"] = time.perf_counter() - start
+        result["week"] = week_label
+        if df_raw is None:
+            return result
+
+        start = time.perf_counter()
+        df_filtered, dotw = prepare_games(df_raw, clock=clock)
+        timings["prepare"] = time.perf_counter() - start
+        result["dotw"] = dotw
+        if df_filtered is None:
+            return result
+
+        sheet = wb[week_label] if week_label in wb.sheetnames else wb.worksheets[0]
+        before = snapshot_sheet(sheet)
+
+        start = time.perf_counter()
+        update_excel(week_label, df_filtered, dotw, wb=wb)
+        timings["update_excel"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if week_label in wb.sheetnames:
+            result["diff"] = diff_sheets(before, snapshot_sheet(wb[week_label]))
+        result["lock_violations"] = check_game_rows(
+            df_raw, df_filtered, dotw, result["diff"], {} if games is None else games
+        )
+        timings["diff"] = time.perf_counter() - start
+        return result
+    finally:
+        DRY_RUN = previous_dry_run
+
+
+def simulate_week(snapshot, week_start, run_times=(dt_time(6, 0),), pages=None):
+    """
+    Simulates the scheduled runs of one pool week (Tuesday through Monday).
+    Runs are chained on one cloned workbook so locked rows carry over like real runs,
+    and each game's row is tracked across them.
+    """
+    wb = clone_workbook(snapshot)
+    games = {}
+    results = []
+    for offset in range(7):
+        day = week_start + timedelta(days=offset)
+        for run_time in run_times:
+            clock = FixedClock(datetime.combine(day, run_time))
+            results.append(simulate_run(wb, clock=clock, pages=pages, games=games))
+    return results
+
+
+def sweep_schedule(df, times):
+    """
+    Vectorized replay of prepare_games() for many "now" values at once.
+    Returns (time x game) boolean masks for remaining, locked and updated games.
+    """
+    kickoffs = pd.to_datetime(df["UTC_DateTime"], errors="coerce", utc=True)
+    times = pd.DatetimeIndex(times)
+    times = times.tz_localize("America/Los_Angeles") if times.tz is None else times
+
+    valid = kickoffs.notna().to_numpy()
+    kickoff_ns = pd.DatetimeIndex(kickoffs).as_unit("ns").asi8
+    now_ns = times.as_unit("ns").asi8
+
+    started = valid[None, :] & (kickoff_ns[None, :] <= now_ns[:, None])
+    remaining = valid[None, :] & ~started
+
+    game_days = kickoffs.dt.tz_convert("America/Los_Angeles").dt.dayofweek.to_numpy()
+    run_days = times.tz_convert("America/Los_Angeles").dayofweek.to_numpy()
+    locked = remaining & (game_days[None, :] == run_days[:, None])
+
+    return {
+        "times": times,
+        "remaining": remaining,
+        "locked": locked,
+        "updated": remaining & ~locked,
+    }
+
+
+def log_simulation(result):
+    logging.info(f"[DRY RUN] Week {result['week']} run at {result['now'] or 'now'} ({result['dotw']})")
+    for change in result["diff"]:
+        logging.info(f"[DRY RUN]   {change['cell']} {change['field']}: {change['before']!r} -> {change['after']!r}")
+    for stage, seconds in result["timings"].items():
+        logging.info(f"[DRY RUN]   {stage}: {seconds * 1000:.1f} ms")
+    for email in result["emails"]:
+        logging.info(f"[DRY RUN]   Recorded email: {email['subject']}")
+    if result["lock_violations"]:
+        logging.warning(f"[DRY RUN] {len(result['lock_violations'])} locked cells changed")
+
+
+def main(clock=None):
     logging.info("Starting NFL pool automation...")
 
     try:
+        if DRY_RUN:
+            wb = clone_workbook(load_workbook_snapshot(os.getenv("file_path")))
+            log_simulation(simulate_run(wb, clock=clock))
+            logging.info("NFL pool automation dry run complete.")
+            return
+
         # ✅ Scrape and normalize
         df_raw, week_label = scrape_nfl_data()
 
@@ -580,59 +1753,16 @@ def main():
         logging.info(f"Scraping data for Week {week_label}")
         logging.info(f"Scraped {len(df_raw)} games")
 
-        # ✅ Localize game_day to Pacific Time
-        df_raw["game_day"] = (
-            pd.to_datetime(df_raw["UTC_DateTime"], errors="coerce", utc=True)
-            .dt.tz_convert("America/Los_Angeles")
-            .dt.day_name()
-        )
-
-        # ✅ Preview game_day assignments
-        logging.info("Preview of game_day assignments:")
-        logging.info(df_raw[["Team1", "Team2", "UTC_DateTime", "game_day"]].to_string(index=False))
-
-        df_raw = normalize_matchkeys(df_raw)
-
-        # ✅ Count how many games have already started
-        now = datetime.now(pytz.timezone("America/Los_Angeles"))
-        df_raw["UTC_DateTime"] = pd.to_datetime(df_raw["UTC_DateTime"], errors="coerce")
-        excluded_count = len(df_raw[df_raw["UTC_DateTime"] <= now])
-        logging.info(f"Detected {excluded_count} played games before {now.strftime('%A %I:%M %p')}")
-
-        # ✅ Assign Excel_Row based on full schedule, offset by excluded games
-        df_raw = df_raw.reset_index(drop=True)
-        df_raw["Excel_Row"] = df_raw.index + 2 + excluded_count  # Dynamic offset
-
-        # ✅ Filter out played games — Excel_Row is preserved
-        df_filtered, dotw = filter_games_by_day(df_raw)
-
-        # ✅ Confirm Excel_Row exists
-        if "Excel_Row" not in df_filtered.columns:
-            msg = "Excel_Row missing from filtered DataFrame. Aborting."
-            logging.critical(msg)
-            send_error_email(
-                subject="NFL Automation Critical Error: Excel_Row Missing",
-                body=msg,
-                log_path=log_file
-            )
+        df_filtered, dotw = prepare_games(df_raw, clock=clock)
+        if df_filtered is None:
             return
 
-        # ✅ Confirm all rows have Excel_Row
-        unmatched = df_filtered[df_filtered["Excel_Row"].isna()]
-        if not unmatched.empty:
-            logging.warning(f"Unmatched rows after filtering: {len(unmatched)}")
-            for _, row in unmatched.iterrows():
-                logging.warning(f"  {row['Team1']} vs {row['Team2']} — MatchKey: {row['MatchKey']}")
-        else:
-            logging.info("[OK] All filtered games have Excel_Row assigned.")
-
-        # ✅ Preview post-filter
-        logging.info("Post-filter preview:")
-        preview_cols = ["Team1", "Team2", "MatchKey", "Excel_Row"]
-        logging.info(df_filtered[preview_cols].to_string(index=False))
-
         # ✅ Update Excel
-        update_excel(week_label, df_filtered, dotw)
+        wb = update_excel(week_label, df_filtered, dotw)
+
+        # ✅ Export lightweight copies of the week's lines
+        if wb is not None and EXPORT_DIR:
+            export_slate(wb, week_label, EXPORT_DIR)
 
         logging.info("NFL pool automation complete.")
 
@@ -645,4 +1775,7 @@ def main():
         )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "standings":
+        update_standings()
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pool import GAME_COLUMNS, parse_game_card, build_game_batch
+
+# Replay every mock card this many times to simulate a season of scraped slates
+REPLAYS = 20000
+
+# Parse the mock slates once
+mock_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_html")
+records = []
+for filename in sorted(os.listdir(mock_dir)):
+    with open(os.path.join(mock_dir, filename), "r", encoding="utf-8") as f:
+        soup = BeautifulSoup(f.read(), "html.parser")
+    records.extend(parse_game_card(card) for card in soup.find_all("div", class_="event-card"))
+
+replay = records * REPLAYS
+print(f"\n📋 Replaying {len(records)} mock games x {REPLAYS} = {len(replay):,} records")
+
+# Current approach: object-dtype DataFrame straight from the rows
+start = time.perf_counter()
+legacy = pd.DataFrame(replay, columns=GAME_COLUMNS)
+legacy_seconds = time.perf_counter() - start
+legacy_bytes = legacy.memory_usage(deep=True).sum()
+
+# Typed columnar batch, and the DataFrame built from it
+start = time.perf_counter()
+batch = build_game_batch(replay)
+batch_seconds = time.perf_counter() - start
+batch_bytes = sum(getattr(batch, name).nbytes for name in
+                  ["team1", "team2", "team1_abbr", "team2_abbr", "spread", "kickoff", "favorite_side"])
+
+start = time.perf_counter()
+typed = batch.to_frame()
+frame_seconds = time.perf_counter() - start
+typed_bytes = typed.memory_usage(deep=True).sum()
+
+print(f"\n{'':<22}{'build':>10}{'memory':>14}{'rows/s':>14}")
+print(f"{'object DataFrame':<22}{legacy_seconds:>9.2f}s{legacy_bytes / 1e6:>12.1f}MB{len(replay) / legacy_seconds:>14,.0f}")
+print(f"{'GameBatch':<22}{batch_seconds:>9.2f}s{batch_bytes / 1e6:>12.1f}MB{len(replay) / batch_seconds:>14,.0f}")
+print(f"{'GameBatch.to_frame()':<22}{frame_seconds:>9.2f}s{typed_bytes / 1e6:>12.1f}MB{len(replay) / frame_seconds:>14,.0f}")
+print(f"\n✅ Typed frame uses {legacy_bytes / typed_bytes:.1f}x less memory than the object-dtype frame")
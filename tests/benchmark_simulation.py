@@ -0,0 +1,26 @@
+import os
+import sys
+import time
+import logging
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pool import load_workbook_snapshot, simulate_week
+from live_page import URL, build_page
+
+# Number of simulated pool weeks (7 scheduled runs each)
+WEEKS = 50
+
+logging.disable(logging.CRITICAL)
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+snapshot = load_workbook_snapshot(os.path.join(root, "Family Football Pool Template.xlsx"))
+pages = {URL: build_page()}
+
+start = time.perf_counter()
+for _ in range(WEEKS):
+    simulate_week(snapshot, date(2025, 11, 25), pages=pages)
+seconds = time.perf_counter() - start
+
+runs = WEEKS * 7
+print(f"\n📋 Simulated {runs} scheduled runs ({WEEKS} weeks)")
+print(f"✅ {seconds:.2f}s total, {seconds / runs * 1000:.1f} ms per run")
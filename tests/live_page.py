@@ -0,0 +1,36 @@
+"""Odds page in the live scoresandodds format, shared by the simulation tests."""
+
+URL = "https://www.scoresandodds.com/nfl"
+
+# Week 12 of 2025 in the live page format: ISO kickoff times and current-spread cells
+GAMES = [
+    ("Lions", "DET", "Bears", "CHI", "-3.5", "home", "2025-11-28T01:15:00+00:00"),     # Thursday night
+    ("Cowboys", "DAL", "Giants", "NYG", "-6.5", "away", "2025-11-30T18:00:00+00:00"),  # Sunday early
+    ("Rams", "LAR", "Seahawks", "SEA", "+2.5", "home", "2025-11-30T21:25:00+00:00"),   # Sunday late
+    ("49ers", "SF", "Packers", "GB", "-1.0", "away", "2025-12-01T01:20:00+00:00"),     # Sunday night
+    ("Bills", "BUF", "Jets", "NYJ", "-7.0", "away", "2025-12-02T01:15:00+00:00"),      # Monday night
+]
+
+CARD = """
+<div class="event-card">
+  <table>
+    <tr data-side="away"><td><span class="team-name"><a data-abbr="{away_abbr}"><span>{away}</span></a></span></td></tr>
+    <tr data-side="home"><td><span class="team-name"><a data-abbr="{home_abbr}"><span>{home}</span></a></span></td></tr>
+  </table>
+  <td data-field="current-spread" data-side="{side}"><span class="data-value">{spread}</span></td>
+  <span data-value="{kickoff}"></span>
+</div>
+"""
+
+def build_page(week="12", games=GAMES):
+    cards = "".join(
+        CARD.format(away=away, away_abbr=away_abbr, home=home, home_abbr=home_abbr,
+                    spread=spread, side=side, kickoff=kickoff)
+        for away, away_abbr, home, home_abbr, spread, side, kickoff in games
+    )
+    picker = (
+        '<div class="filters-week-picker"><div class="selector week-picker-week">'
+        f'<li class="menu-item active"><span data-endpoint="nfl">{week}</span></li>'
+        '</div></div>'
+    )
+    return picker + cards
@@ -0,0 +1,96 @@
+import logging
+import pytest
+import pandas as pd
+from datetime import datetime, timedelta
+from bs4 import BeautifulSoup
+from pool import (
+    GAME_COLUMNS,
+    FixedClock,
+    parse_game_card,
+    apply_team_abbreviations,
+    filter_games_by_day,
+    prepare_games,
+    sweep_schedule
+)
+
+FIXTURES = [
+    "thanksgiving.html",
+    "friday_game.html",
+    "black_friday.html",
+    "saturday_tripleheader.html",
+    "christmas_tuesday.html",
+    "christmas_wednesday.html",
+]
+
+def load_mock_html(filename):
+    with open(f"tests/mock_html/{filename}", "r", encoding="utf-8") as f:
+        return BeautifulSoup(f.read(), "html.parser")
+
+def load_games(filename):
+    soup = load_mock_html(filename)
+    rows = [parse_game_card(card) for card in soup.find_all("div", class_="event-card")]
+    df = pd.DataFrame(rows, columns=GAME_COLUMNS)
+    return apply_team_abbreviations(df)
+
+def week_of_minutes(df):
+    # Seven days of minutes from midnight the day before the earliest game
+    first = pd.to_datetime(df["UTC_DateTime"], utc=True).min().tz_convert("America/Los_Angeles")
+    start = (first - timedelta(days=1)).normalize()
+    return pd.date_range(start, start + timedelta(days=7), freq="min", inclusive="left")
+
+def test_fixed_clock_is_pacific():
+    clock = FixedClock(datetime(2025, 11, 27, 9, 0))
+    assert clock.now().tzinfo is not None
+    assert clock.now().strftime("%A %H:%M") == "Thursday 09:00"
+    clock.advance(timedelta(hours=16))
+    assert clock.now().strftime("%A %H:%M") == "Friday 01:00"
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_filter_uses_injected_clock(filename):
+    df = load_games(filename)
+    first_kickoff = pd.to_datetime(df["UTC_DateTime"], utc=True).min()
+
+    before, _ = filter_games_by_day(df.copy(), clock=FixedClock(first_kickoff - timedelta(minutes=1)))
+    after, _ = filter_games_by_day(df.copy(), clock=FixedClock(first_kickoff))
+    assert len(before) == len(df)
+    assert len(after) < len(df)
+
+@pytest.mark.parametrize("filename", FIXTURES)
+def test_week_sweep(filename):
+    df = load_games(filename)
+    times = week_of_minutes(df)
+    sweep = sweep_schedule(df, times)
+
+    assert sweep["remaining"].shape == (len(times), len(df))
+    # Games only ever leave the slate, and locked games are never updated
+    remaining_count = sweep["remaining"].sum(axis=1)
+    assert (remaining_count[1:] <= remaining_count[:-1]).all()
+    assert not (sweep["locked"] & sweep["updated"]).any()
+
+    # Each game is locked from midnight on its game day until kickoff, and updated before that
+    kickoffs = pd.DatetimeIndex(pd.to_datetime(df["UTC_DateTime"], utc=True)).tz_convert(times.tz)
+    for index, kickoff in enumerate(kickoffs):
+        game_day = (times >= kickoff.normalize()) & (times < kickoff)
+        before = times < kickoff.normalize()
+        assert game_day.any() and (sweep["locked"][:, index] == game_day).all()
+        assert before.any() and sweep["updated"][before, index].all()
+
+    # Check the sweep against the real pipeline every 6 hours, plus at each kickoff
+    # minute and the minute before it, where filtering and locking change
+    boundaries = times.get_indexer(kickoffs)
+    checks = set(range(0, len(times), 360))
+    checks.update(i for i in boundaries if i >= 0)
+    checks.update(i - 1 for i in boundaries if i > 0)
+    assert any(i in checks for i in boundaries)
+
+    logging.disable(logging.CRITICAL)
+    try:
+        for i in sorted(checks):
+            df_filtered, dotw = prepare_games(df.copy(), clock=FixedClock(times[i].to_pydatetime()))
+            assert set(df_filtered.index) == set(sweep["remaining"][i].nonzero()[0])
+            locked = df_filtered[df_filtered["game_day"] == dotw]
+            assert set(locked.index) == set(sweep["locked"][i].nonzero()[0])
+            # Games keep their place in the full schedule as earlier games drop off
+            assert (df_filtered["Excel_Row"] == df_filtered.index + 2).all()
+    finally:
+        logging.disable(logging.NOTSET)
@@ -5,6 +5,7 @@ import logging
 from datetime import datetime
 from bs4 import BeautifulSoup
 from pool import (
+    GAME_COLUMNS,
     parse_game_card,
     get_week_number,
     apply_team_abbreviations,
@@ -44,10 +45,7 @@ def test_abbreviation_mapping():
     soup = load_mock_html("christmas_tuesday.html")
     cards = soup.find_all("div", class_="event-card")
     rows = [row for card in cards if (row := parse_game_card(card)) is not None]
-    df = pd.DataFrame(rows, columns=[
-        "Team1", "Spread", "Team2", "Team1_Abbr", "Team2_Abbr",
-        "Home_Team", "UTC_DateTime", "Favorite_Side"
-    ])
+    df = pd.DataFrame(rows, columns=GAME_COLUMNS)
     df = apply_team_abbreviations(df)
     assert all(df["Team1_Abbr"].notnull()) and all(df["Team2_Abbr"].notnull())
 
@@ -68,10 +66,7 @@ def test_excel_row_assignment_thanksgiving():
         assert isinstance(row[6], datetime), f"Invalid datetime: {row[6]}"
         rows.append(row)
 
-    df = pd.DataFrame(rows, columns=[
-        "Team1", "Spread", "Team2", "Team1_Abbr", "Team2_Abbr",
-        "Home_Team", "UTC_DateTime", "Favorite_Side"
-    ])
+    df = pd.DataFrame(rows, columns=GAME_COLUMNS)
     df = apply_team_abbreviations(df)
     df["Excel_Row"] = assign_excel_rows(df)
 
@@ -100,10 +95,7 @@ def test_excel_row_assignment_saturday_tripleheader():
         assert isinstance(row[6], datetime), f"Invalid datetime: {row[6]}"
         rows.append(row)
 
-    df = pd.DataFrame(rows, columns=[
-        "Team1", "Spread", "Team2", "Team1_Abbr", "Team2_Abbr",
-        "Home_Team", "UTC_DateTime", "Favorite_Side"
-    ])
+    df = pd.DataFrame(rows, columns=GAME_COLUMNS)
     df = apply_team_abbreviations(df)
     df["Excel_Row"] = assign_excel_rows(df)
 
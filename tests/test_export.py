@@ -0,0 +1,51 @@
+import csv
+import json
+import os
+import pytest
+from datetime import datetime
+from pool import (
+    FixedClock,
+    load_workbook_snapshot,
+    clone_workbook,
+    simulate_run,
+    export_slate
+)
+from live_page import GAMES, URL, build_page
+
+@pytest.fixture
+def week_workbook():
+    wb = clone_workbook(load_workbook_snapshot("Family Football Pool Template.xlsx"))
+    simulate_run(wb, clock=FixedClock(datetime(2025, 11, 25, 6, 0)), pages={URL: build_page()})
+    return wb
+
+def test_export_writes_all_formats(week_workbook, tmp_path):
+    written = export_slate(week_workbook, "12", tmp_path)
+    assert all(written[fmt] for fmt in ("csv", "json", "html"))
+
+    with open(tmp_path / "week_12.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    with open(tmp_path / "week_12.json") as f:
+        data = json.load(f)
+    assert len(rows) == len(data["games"]) == len(GAMES)
+    assert data["week"] == "12"
+
+    # Bears are -3.5 home favorites over the visiting Lions; the last two games are SNF and MNF
+    first = data["games"][0]
+    assert (first["favorite"], first["spread"], first["underdog"], first["home"]) == ("BEARS", 3.5, "LIONS", "favorite")
+    assert [game["night_game"] for game in data["games"]] == [False, False, False, True, True]
+
+    page = (tmp_path / "week_12.html").read_text()
+    assert page.count("<tr") == len(GAMES) + 1
+    assert "Week 12" in page
+
+def test_export_skips_unchanged_files(week_workbook, tmp_path):
+    export_slate(week_workbook, "12", tmp_path)
+    mtime = os.path.getmtime(tmp_path / "week_12.csv")
+
+    written = export_slate(week_workbook, "12", tmp_path)
+    assert written == {"csv": None, "json": None, "html": None}
+    assert os.path.getmtime(tmp_path / "week_12.csv") == mtime
+
+    week_workbook["12"].cell(row=2, column=4).value = 4.5
+    written = export_slate(week_workbook, "12", tmp_path)
+    assert all(written.values())
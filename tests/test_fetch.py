@@ -0,0 +1,127 @@
+import gzip
+import threading
+import time
+import pytest
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pool
+from pool import (
+    CircuitBreaker,
+    FixedClock,
+    OddsSource,
+    fetch_with_retry,
+    fetch_odds_page
+)
+
+PAGE = b'<div class="event-card"><span>ok</span></div>'
+
+class StubServer:
+    """Local HTTP server that answers with a scripted list of status codes (last one repeats)."""
+
+    def __init__(self, statuses, body=PAGE, gzip_body=False):
+        self.statuses = list(statuses)
+        self.hits = 0
+        self.client_ports = set()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stub.client_ports.add(self.client_address[1])
+                status = stub.statuses[min(stub.hits, len(stub.statuses) - 1)]
+                stub.hits += 1
+                payload = gzip.compress(body) if gzip_body else body
+                self.send_response(status)
+                if gzip_body:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/nfl"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(*args, **kwargs):
+        server = StubServer(*args, **kwargs)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+@pytest.fixture(autouse=True)
+def fresh_session(monkeypatch):
+    monkeypatch.setattr(pool, "http_session", None)
+
+def test_retries_then_succeeds(stub):
+    server = stub([503, 503, 200])
+    response = fetch_with_retry(server.url, backoff_factor=0.01)
+    assert response.status_code == 200
+    assert server.hits == 3
+
+def test_deadline_caps_total_time(stub):
+    server = stub([503])
+    start = time.monotonic()
+    with pytest.raises(ConnectionError):
+        fetch_with_retry(server.url, max_retries=10, backoff_factor=2, deadline=0.5)
+    assert time.monotonic() - start < 2
+    assert server.hits < 10
+
+def test_session_reuses_connection_and_decodes_gzip(stub):
+    server = stub([200], gzip_body=True)
+    for _ in range(3):
+        assert fetch_with_retry(server.url).content == PAGE
+    assert len(server.client_ports) == 1
+
+def test_falls_back_to_mirror(stub, tmp_path):
+    down, mirror = stub([500]), stub([200])
+    sources = [OddsSource("primary", down.url), OddsSource("mirror-1", mirror.url)]
+    breaker = CircuitBreaker(path=tmp_path / "circuit.json")
+
+    soup, source = fetch_odds_page(sources, breaker, max_retries=2, backoff_factor=0.01)
+    assert source.name == "mirror-1"
+    assert soup.find("div", class_="event-card") is not None
+    assert down.hits == 2
+
+def test_circuit_opens_persists_and_half_opens(stub, tmp_path):
+    down, mirror = stub([500]), stub([200])
+    sources = [OddsSource("primary", down.url), OddsSource("mirror-1", mirror.url)]
+    path = tmp_path / "circuit.json"
+    clock = FixedClock(datetime(2025, 11, 25, 6, 0))
+
+    for _ in range(pool.CIRCUIT_FAILURE_THRESHOLD):
+        fetch_odds_page(sources, CircuitBreaker(path=path, clock=clock), max_retries=1)
+    hits = down.hits
+
+    # A later scheduled run loads the open circuit and skips the primary
+    breaker = CircuitBreaker(path=path, clock=clock)
+    assert not breaker.allow(down.url)
+    _, source = fetch_odds_page(sources, breaker, max_retries=1)
+    assert source.name == "mirror-1" and down.hits == hits
+
+    # After the cooldown the primary is tried again, and closes once it recovers
+    down.statuses = [200]
+    clock.advance(pool.CIRCUIT_COOLDOWN + timedelta(minutes=1))
+    breaker = CircuitBreaker(path=path, clock=clock)
+    _, source = fetch_odds_page(sources, breaker, max_retries=1)
+    assert source.name == "primary"
+    assert CircuitBreaker(path=path, clock=clock).state == {}
+
+def test_all_sources_down_returns_none(stub, tmp_path):
+    down = stub([503])
+    breaker = CircuitBreaker(path=tmp_path / "circuit.json")
+    assert fetch_odds_page([OddsSource("primary", down.url)], breaker, max_retries=1) == (None, None)
@@ -0,0 +1,90 @@
+import math
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+import pytz
+from bs4 import BeautifulSoup
+from pool import (
+    GAME_COLUMNS,
+    GameRecord,
+    FixedClock,
+    parse_game_card,
+    build_game_batch,
+    validate_game_record,
+    apply_team_abbreviations,
+    extract_favorite_underdog,
+    load_workbook_snapshot,
+    clone_workbook,
+    simulate_run
+)
+from live_page import GAMES, URL, build_page
+
+def load_mock_html(filename):
+    with open(f"tests/mock_html/{filename}", "r", encoding="utf-8") as f:
+        return BeautifulSoup(f.read(), "html.parser")
+
+def make_record(**overrides):
+    fields = dict(
+        team1="COWBOYS", spread=-6.5, team2="GIANTS", team1_abbr="DAL", team2_abbr="NYG",
+        home_team="GIANTS", utc_datetime=datetime(2025, 11, 27, 21, 30, tzinfo=pytz.utc), favorite_side="away"
+    )
+    fields.update(overrides)
+    return GameRecord(**fields)
+
+@pytest.mark.parametrize("filename", [
+    "thanksgiving.html",
+    "saturday_tripleheader.html",
+    "christmas_wednesday.html",
+])
+def test_batch_matches_legacy_frame(filename):
+    soup = load_mock_html(filename)
+    records = [parse_game_card(card) for card in soup.find_all("div", class_="event-card")]
+    legacy = pd.DataFrame(records, columns=GAME_COLUMNS)
+    typed = build_game_batch(records).to_frame()
+
+    assert list(typed.columns) == GAME_COLUMNS
+    for column in ["Team1", "Team2", "Team1_Abbr", "Team2_Abbr", "Home_Team"]:
+        assert typed[column].astype(str).tolist() == legacy[column].astype(str).tolist()
+    assert (typed["UTC_DateTime"] == pd.to_datetime(legacy["UTC_DateTime"], utc=True)).all()
+    np.testing.assert_array_equal(typed["Spread"].to_numpy(), legacy["Spread"].to_numpy(dtype=np.float32))
+    assert typed["Favorite_Side"].astype(object).where(typed["Favorite_Side"].notna(), None).tolist() == \
+        legacy["Favorite_Side"].tolist()
+
+def test_batch_types():
+    batch = build_game_batch([make_record(), make_record(spread=math.nan, favorite_side=None, utc_datetime=None)])
+    assert batch.spread.dtype == np.float32 and np.isnan(batch.spread[1])
+    assert batch.kickoff.dtype == np.int64
+    assert batch.team1.tolist() == [0, 0] and batch.team2.tolist() == [1, 1]
+
+    df = batch.to_frame()
+    assert isinstance(df["Team1"].dtype, pd.CategoricalDtype)
+    assert pd.isna(df["UTC_DateTime"].iloc[1])
+    assert df["Favorite_Side"].tolist()[0] == "away" and pd.isna(df["Favorite_Side"].iloc[1])
+
+def test_abbreviations_keep_team_columns_categorical():
+    df = apply_team_abbreviations(build_game_batch([make_record(team1="Cowboys", team2="Giants")]).to_frame())
+    for column in ["Team1", "Team2", "Team1_Abbr", "Team2_Abbr"]:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert (df["Team1"].iloc[0], df["Team1_Abbr"].iloc[0]) == ("COWBOYS", "DAL")
+
+def test_missing_kickoff_keeps_later_rows():
+    # The Cowboys kickoff can't be parsed; the game stays in the frame so later games keep their rows
+    games = [game[:-1] + ("TBD",) if game[0] == "Cowboys" else game for game in GAMES]
+    wb = clone_workbook(load_workbook_snapshot("Family Football Pool Template.xlsx"))
+    result = simulate_run(wb, clock=FixedClock(datetime(2025, 11, 25, 6, 0)), pages={URL: build_page(games=games)})
+    written = {change["row"] for change in result["diff"] if change["field"] == "value"}
+    assert written == {2, 4, 5, 6}
+    assert wb["12"].cell(row=4, column=9).value == "LAR"
+
+def test_tbd_spread_from_batch_is_tbd():
+    df = build_game_batch([make_record(spread=math.nan, favorite_side=None)]).to_frame()
+    assert extract_favorite_underdog(df.iloc[0])[:2] == ("TBD", "TBD")
+
+def test_validation():
+    assert validate_game_record(make_record()) == []
+    assert validate_game_record(make_record(team1_abbr="")) == ["missing team1_abbr"]
+    assert validate_game_record(make_record(spread="-3.5"))
+    assert validate_game_record(make_record(favorite_side="neutral"))
+    assert validate_game_record(make_record(utc_datetime=datetime(2025, 11, 27)))
+    assert validate_game_record(make_record(utc_datetime=None)) == []
@@ -0,0 +1,64 @@
+import json
+import pytest
+from bs4 import BeautifulSoup
+from openpyxl import Workbook
+import pool
+from pool import (
+    fingerprint_page,
+    structure_drift,
+    record_fingerprint,
+    simulate_run
+)
+from live_page import URL, build_page
+
+def load_mock_html(filename):
+    with open(f"tests/mock_html/{filename}", "r", encoding="utf-8") as f:
+        return BeautifulSoup(f.read(), "html.parser")
+
+@pytest.mark.parametrize("filename", [
+    "thanksgiving.html",
+    "friday_game.html",
+    "black_friday.html",
+    "saturday_tripleheader.html",
+    "christmas_tuesday.html",
+    "christmas_wednesday.html",
+])
+def test_mock_pages_have_required_selectors(filename):
+    broken, degraded = structure_drift(fingerprint_page(load_mock_html(filename)))
+    assert broken == []
+
+def test_live_format_has_every_selector():
+    assert structure_drift(fingerprint_page(BeautifulSoup(build_page(), "html.parser"))) == ([], [])
+
+@pytest.mark.parametrize("old,new,selector", [
+    ('class="event-card"', 'class="game-card"', "event_card"),
+    ('data-side="home"', 'data-team="home"', "home_team"),
+    ('data-abbr=', 'data-short=', "away_team"),
+    ('class="filters-week-picker"', 'class="week-filter"', "week_picker"),
+])
+def test_drift_stops_run_before_parsing(monkeypatch, old, new, selector):
+    calls = []
+    monkeypatch.setitem(pool.PARSERS["scoresandodds"], "card", lambda *args, **kwargs: calls.append(args))
+
+    result = simulate_run(Workbook(), pages={URL: build_page().replace(old, new)})
+    assert calls == []
+    assert result["diff"] == []
+    assert [email["subject"] for email in result["emails"]] == ["NFL Scraper Error: Page Structure Changed"]
+    assert selector in result["emails"][0]["body"]
+
+def test_missing_spread_is_only_degraded():
+    page = build_page().replace('data-field="current-spread"', 'data-field="line"')
+    broken, degraded = structure_drift(fingerprint_page(BeautifulSoup(page, "html.parser")))
+    assert broken == [] and degraded[0].startswith("current_spread")
+
+def test_corpus_records_only_changes(tmp_path):
+    path = tmp_path / "fingerprints.jsonl"
+    live = fingerprint_page(BeautifulSoup(build_page(), "html.parser"))
+    mock = fingerprint_page(load_mock_html("thanksgiving.html"))
+
+    for fingerprint in (live, live, mock, mock, live):
+        record_fingerprint(fingerprint, URL, path=path)
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [entry["card_hash"] for entry in entries] == [live["card_hash"], mock["card_hash"], live["card_hash"]]
+    assert entries[1]["selectors"]["current_spread"] is False
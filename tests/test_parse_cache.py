@@ -0,0 +1,82 @@
+import pytest
+from bs4 import BeautifulSoup
+from pool import parse_game_card, card_fingerprint, GameCardCache
+
+def load_mock_html(filename):
+    with open(f"tests/mock_html/{filename}", "r", encoding="utf-8") as f:
+        return BeautifulSoup(f.read(), "html.parser")
+
+CARD_HTML = """
+<div class="event-card">
+  <table>
+    <tr data-side="away"><span class="team-name"><a data-abbr="DAL"><span>Cowboys</span></a></span></tr>
+    <tr data-side="home"><span class="team-name"><a data-abbr="NYG"><span>Giants</span></a></span></tr>
+  </table>
+  <td data-field="current-spread" data-side="home"><span class="data-value">{spread}</span></td>
+  <span data-value="2025-11-27T21:30:00+00:00"></span>
+</div>
+"""
+
+def make_card(spread):
+    return BeautifulSoup(CARD_HTML.format(spread=spread), "html.parser").find("div", class_="event-card")
+
+@pytest.mark.parametrize("filename", [
+    "thanksgiving.html",
+    "saturday_tripleheader.html",
+    "christmas_tuesday.html",
+])
+def test_cached_rows_match_uncached(filename):
+    soup = load_mock_html(filename)
+    cards = soup.find_all("div", class_="event-card")
+    cache = GameCardCache()
+    expected = [parse_game_card(card) for card in cards]
+    first = [parse_game_card(card, cache=cache) for card in cards]
+    second = [parse_game_card(card, cache=cache) for card in cards]
+    assert first == expected
+    assert second == expected
+    assert cache.hits == len(cards) and cache.misses == len(cards)
+
+def test_spread_change_keeps_fingerprint():
+    old_card, new_card = make_card("-3.5"), make_card("-6.5")
+    assert card_fingerprint(old_card) == card_fingerprint(new_card)
+
+    cache = GameCardCache()
+    parse_game_card(old_card, cache=cache)
+    row = parse_game_card(new_card, cache=cache)
+    assert cache.hits == 1
+    assert row.spread == -6.5
+
+def test_cache_is_lru_bounded():
+    soup = load_mock_html("thanksgiving.html")
+    cards = soup.find_all("div", class_="event-card")
+    cache = GameCardCache(max_size=2)
+    for card in cards:
+        parse_game_card(card, cache=cache)
+    assert len(cache.entries) == 2
+    parse_game_card(cards[0], cache=cache)
+    assert cache.hits == 0
+
+def test_cache_round_trips_through_file(tmp_path):
+    cache = GameCardCache()
+    row = parse_game_card(make_card("-3.5"), cache=cache)
+    path = tmp_path / "parse_cache.json"
+    cache.save(path)
+
+    loaded = GameCardCache.load(path)
+    assert parse_game_card(make_card("-3.5"), cache=loaded) == row
+    assert loaded.hits == 1
+
+def test_average_parse_time_carries_across_runs(tmp_path):
+    fields = ("Cowboys", "DAL", "Giants", "NYG", None)
+    cache = GameCardCache()
+    for key in ("a", "b", "c"):
+        cache.put(key, fields, 0.004)
+    path = tmp_path / "parse_cache.json"
+    cache.save(path)
+
+    # A new run's first miss is one more sample, not a fresh average
+    loaded = GameCardCache.load(path)
+    loaded.reset_stats()
+    loaded.put("d", fields, 0.008)
+    assert loaded.parsed_samples == 4
+    assert loaded.avg_parse_seconds == pytest.approx(0.005)
@@ -0,0 +1,64 @@
+import os
+import pytest
+from datetime import date, datetime
+from pool import (
+    FixedClock,
+    load_workbook_snapshot,
+    clone_workbook,
+    simulate_run,
+    simulate_week
+)
+from live_page import GAMES, URL, build_page
+
+TEMPLATE = "Family Football Pool Template.xlsx"
+
+@pytest.fixture
+def snapshot():
+    return load_workbook_snapshot(TEMPLATE)
+
+def test_simulate_run_writes_every_game_in_memory(snapshot):
+    mtime = os.path.getmtime(TEMPLATE)
+    wb = clone_workbook(snapshot)
+    clock = FixedClock(datetime(2025, 11, 25, 6, 0))
+    result = simulate_run(wb, clock=clock, pages={URL: build_page()})
+
+    assert result["week"] == "12"
+    assert result["requests"] == [URL]
+    assert result["emails"] == []
+    assert "12" in wb.sheetnames
+    assert os.path.getmtime(TEMPLATE) == mtime
+
+    written = {change["row"] for change in result["diff"] if change["field"] == "value"}
+    assert len(written) == len(GAMES)
+    assert set(result["timings"]) == {"scrape", "prepare", "update_excel", "diff"}
+
+def test_simulate_run_records_email_instead_of_sending(snapshot):
+    wb = clone_workbook(snapshot)
+    result = simulate_run(wb, pages={URL: "<html></html>"})
+    assert result["emails"]
+    assert result["diff"] == []
+
+def test_simulate_week_never_touches_locked_rows(snapshot):
+    results = simulate_week(snapshot, date(2025, 11, 25), pages={URL: build_page()})
+
+    assert [result["dotw"] for result in results] == [
+        "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday", "Monday"
+    ]
+    assert all(not result["lock_violations"] for result in results)
+    assert all(not result["emails"] for result in results)
+
+def test_chained_runs_flag_rows_that_move(snapshot):
+    wb = clone_workbook(snapshot)
+    games = {}
+    for day in (25, 27):
+        result = simulate_run(wb, clock=FixedClock(datetime(2025, 11, day, 6, 0)),
+                              pages={URL: build_page()}, games=games)
+        assert result["lock_violations"] == []
+
+    # Friday's page no longer lists Thursday's game, so every later game shifts up a row
+    result = simulate_run(wb, clock=FixedClock(datetime(2025, 11, 28, 6, 0)),
+                          pages={URL: build_page(games=GAMES[1:])}, games=games)
+    violations = result["lock_violations"]
+    assert {change["row"] for change in violations if change["field"] != "row_moved"} == {2}
+    moved = [(change["before"], change["after"]) for change in violations if change["field"] == "row_moved"]
+    assert moved == [(3, 2), (4, 3), (5, 4), (6, 5)]
@@ -0,0 +1,121 @@
+import pytest
+from datetime import datetime
+from bs4 import BeautifulSoup
+from openpyxl import load_workbook
+import pool
+from pool import (
+    FixedClock,
+    load_workbook_snapshot,
+    clone_workbook,
+    simulate_run,
+    update_standings,
+    extract_final_score
+)
+from live_page import URL, build_page
+
+# Favorite/underdog per row of the simulated week 12 sheet:
+# 2 CHI -3.5 DET, 3 DAL -6.5 NYG, 4 LAR -2.5 SEA, 5 SF -1 GB, 6 BUF -7 NYJ
+FINAL_SCORES = {
+    frozenset(("CHI", "DET")): {"CHI": 24, "DET": 20},   # CHI covers
+    frozenset(("DAL", "NYG")): {"DAL": 20, "NYG": 17},   # NYG covers
+    frozenset(("LAR", "SEA")): {"LAR": 27, "SEA": 24},   # LAR covers
+    frozenset(("SF", "GB")): {"SF": 21, "GB": 20},       # push
+    frozenset(("BUF", "NYJ")): {"BUF": 30, "NYJ": 10},   # BUF covers
+}
+
+@pytest.fixture
+def pool_file(tmp_path):
+    wb = clone_workbook(load_workbook_snapshot("Family Football Pool Template.xlsx"))
+    simulate_run(wb, clock=FixedClock(datetime(2025, 11, 25, 6, 0)), pages={URL: build_page()})
+    ws = wb["12"]
+    # HM takes every favorite; DE takes every underdog except row 6
+    for row in range(2, 7):
+        ws.cell(row=row, column=1).value = "X"
+        ws.cell(row=row, column=7 if row < 6 else 2).value = "X"
+    path = tmp_path / "pool.xlsx"
+    wb.save(path)
+    return path
+
+def standings_by_participant(season):
+    return {row.Participant: (row.Wins, row.Losses, row.Pushes) for row in season.itertuples()}
+
+def test_against_the_spread_scoring(pool_file):
+    season = update_standings(file=pool_file, results=FINAL_SCORES)
+    assert standings_by_participant(season) == {"HM": (3, 1, 1), "DE": (2, 2, 1)}
+
+    ws = load_workbook(pool_file)["Standings"]
+    assert ws["A2"].value == "12" and ws["F2"].value is True
+    assert ws["H2"].value == "HM"
+
+def test_pending_games_are_not_graded(pool_file):
+    partial = {key: value for key, value in FINAL_SCORES.items() if "BUF" not in key}
+    season = update_standings(file=pool_file, results=partial)
+    assert standings_by_participant(season) == {"HM": (2, 1, 1), "DE": (1, 2, 1)}
+    assert load_workbook(pool_file)["Standings"]["F2"].value is False
+
+def test_final_weeks_are_not_rescored(pool_file):
+    update_standings(file=pool_file, results=FINAL_SCORES)
+
+    # Changing a final week's picks must not change its stored standings
+    wb = load_workbook(pool_file)
+    wb["12"].cell(row=2, column=1).value = None
+    wb.save(pool_file)
+
+    season = update_standings(file=pool_file)
+    assert standings_by_participant(season) == {"HM": (3, 1, 1), "DE": (2, 2, 1)}
+
+def test_partly_picked_week_is_rescored(pool_file):
+    # Friday: only Thursday's game has picks and a final score
+    later_picks = [(row, col) for row in range(3, 7) for col in (1, 7 if row < 6 else 2)]
+    wb = load_workbook(pool_file)
+    for row, col in later_picks:
+        wb["12"].cell(row=row, column=col).value = None
+    wb.save(pool_file)
+
+    thursday = {key: value for key, value in FINAL_SCORES.items() if "CHI" in key}
+    season = update_standings(file=pool_file, results=thursday)
+    assert standings_by_participant(season) == {"HM": (1, 0, 0), "DE": (0, 1, 0)}
+    assert load_workbook(pool_file)["Standings"]["F2"].value is False
+
+    # Tuesday: the remaining picks and scores are in
+    wb = load_workbook(pool_file)
+    for row, col in later_picks:
+        wb["12"].cell(row=row, column=col).value = "X"
+    wb.save(pool_file)
+
+    season = update_standings(file=pool_file, results=FINAL_SCORES)
+    assert standings_by_participant(season) == {"HM": (3, 1, 1), "DE": (2, 2, 1)}
+    assert load_workbook(pool_file)["Standings"]["F2"].value is True
+
+def test_extract_final_score():
+    table = BeautifulSoup(
+        '<div class="event-card"><table>'
+        '<tr data-side="away"><td data-field="score">17</td></tr>'
+        '<tr data-side="home"><td data-field="score"></td></tr>'
+        '</table></div>', "html.parser")
+    assert extract_final_score(table, "away") == 17
+    assert extract_final_score(table, "home") is None
+
+def test_missing_results_file_falls_back_to_workbook(pool_file, monkeypatch, tmp_path):
+    monkeypatch.setattr(pool, "RESULTS_FILE", str(tmp_path / "missing.csv"))
+    season = update_standings(file=pool_file)
+    assert standings_by_participant(season) == {"HM": (0, 0, 0), "DE": (0, 0, 0)}
+    assert load_workbook(pool_file)["Standings"]["F2"].value is False
+
+def test_results_url_scores_games(pool_file, monkeypatch):
+    card = (
+        '<div class="event-card"><table>'
+        '<tr data-side="away"><td><span class="team-name"><a data-abbr="{0}"><span>{0}</span></a></span></td>'
+        '<td data-field="score">{1}</td></tr>'
+        '<tr data-side="home"><td><span class="team-name"><a data-abbr="{2}"><span>{2}</span></a></span></td>'
+        '<td data-field="score">{3}</td></tr>'
+        '</table><div class="game-date">Sunday, November 30, 2025</div></div>'
+    )
+    page = "".join(card.format(away, scores[away], home, scores[home])
+                   for away, home in (sorted(teams) for teams in FINAL_SCORES)
+                   for scores in [FINAL_SCORES[frozenset((away, home))]])
+    monkeypatch.setattr(pool, "RESULTS_URL", "https://example.test/scores")
+    monkeypatch.setattr(pool, "get_webpage", lambda url, **kwargs: BeautifulSoup(page, "html.parser"))
+
+    season = update_standings(file=pool_file)
+    assert standings_by_participant(season) == {"HM": (3, 1, 1), "DE": (2, 2, 1)}